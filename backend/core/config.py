@@ -1,18 +1,54 @@
 """Configuration management for SamvadQL backend."""
 
+import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Union
+from typing import Any, Optional, Tuple
 from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings
+from pydantic.fields import FieldInfo
+from pydantic_settings import (
+    BaseSettings,
+    DotEnvSettingsSource,
+    EnvSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
 
 # Get the project root directory (two levels up from this file)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 ENV_FILE = PROJECT_ROOT / ".env"
 
+# Fields whose raw env value is passed to their validator instead of being
+# JSON-decoded first, so comma-separated values are accepted
+RAW_ENV_FIELDS = frozenset({"allowed_origins"})
+
+
+class _RawEnvFieldsMixin:
+    """Skip pydantic-settings' JSON decoding for RAW_ENV_FIELDS."""
+
+    def prepare_field_value(
+        self, field_name: str, field: FieldInfo, value: Any, value_is_complex: bool
+    ) -> Any:
+        if field_name in RAW_ENV_FIELDS:
+            return value
+        return super().prepare_field_value(field_name, field, value, value_is_complex)
+
+
+class _EnvSettingsSource(_RawEnvFieldsMixin, EnvSettingsSource):
+    pass
+
+
+class _DotEnvSettingsSource(_RawEnvFieldsMixin, DotEnvSettingsSource):
+    pass
+
 
 class Settings(BaseSettings):
     """Application settings."""
 
+    model_config = SettingsConfigDict(
+        env_file=ENV_FILE, case_sensitive=False, extra="ignore"
+    )
+
     # API Configuration
     api_title: str = "SamvadQL API"
     api_version: str = "1.0.0"
@@ -58,21 +94,30 @@ class Settings(BaseSettings):
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
 
-    allowed_origins: Union[List[str], str] = Field(
-        default=["http://localhost:3000"], validation_alias="ALLOWED_ORIGINS"
+    allowed_origins: Tuple[str, ...] = Field(
+        default=("http://localhost:3000",), validation_alias="ALLOWED_ORIGINS"
     )
 
     @field_validator("allowed_origins", mode="before")
     @classmethod
     def parse_allowed_origins(cls, v):
         if isinstance(v, str):
-            # Handle comma-separated string
+            v = v.strip()
             if v.startswith("[") and v.endswith("]"):
-                # Already JSON format, let pydantic handle it
-                return v
+                # JSON list, or a bracketed list of unquoted origins
+                try:
+                    v = json.loads(v)
+                except ValueError:
+                    v = v[1:-1].split(",")
             else:
                 # Comma-separated string
-                return [origin.strip() for origin in v.split(",") if origin.strip()]
+                v = v.split(",")
+        if isinstance(v, (list, tuple, set, frozenset)):
+            return tuple(
+                origin
+                for origin in (o.strip() if isinstance(o, str) else o for o in v)
+                if origin
+            )
         return v
 
     # Performance
@@ -83,10 +128,34 @@ class Settings(BaseSettings):
         default=30, validation_alias="QUERY_TIMEOUT_SECONDS"
     )
 
-    class Config:
-        env_file = ENV_FILE
-        case_sensitive = False
-        extra = "ignore"
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: EnvSettingsSource,
+        dotenv_settings: DotEnvSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        # Same env/.env sources, rebuilt so RAW_ENV_FIELDS reach their validators
+        env_settings = _EnvSettingsSource(
+            settings_cls,
+            case_sensitive=env_settings.case_sensitive,
+            env_prefix=env_settings.env_prefix,
+            env_nested_delimiter=env_settings.env_nested_delimiter,
+        )
+        dotenv_settings = _DotEnvSettingsSource(
+            settings_cls,
+            env_file=dotenv_settings.env_file,
+            env_file_encoding=dotenv_settings.env_file_encoding,
+            case_sensitive=dotenv_settings.case_sensitive,
+            env_prefix=dotenv_settings.env_prefix,
+            env_nested_delimiter=dotenv_settings.env_nested_delimiter,
+        )
+        return init_settings, env_settings, dotenv_settings, file_secret_settings
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the application settings, loading them on first use."""
+    return Settings()
@@ -4,7 +4,7 @@ Example usage of LangChain service for SamvadQL.
 
 import asyncio
 from services.langchain_service import LangChainLLMService
-from models.base import TableSchema, ColumnSchema
+from models.base import TableSchema, ColumnSchema, ValidationStatus
 
 
 async def example_sql_generation():
@@ -113,6 +113,10 @@ async def example_sql_generation():
                 context={"database_type": "postgresql", "request_id": f"example_{i}"},
             )
             async for response in response_iterator:
+                # Skip partial updates streamed while generation is in progress
+                if response.validation_status == ValidationStatus.PENDING:
+                    continue
+
                 print(f"🔍 Generated SQL:")
                 print(response.sql)
                 print(f"\n💡 Explanation:")
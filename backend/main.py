@@ -4,22 +4,36 @@ Main FastAPI application entry point for SamvadQL.
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+from brotli_asgi import BrotliMiddleware
+import logging
 import uvicorn
 
-from core.config import settings
+from core.config import get_settings
+from core.logging_config import start_logging, stop_logging
 from models.base import QueryRequest
 
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# HTTP 501 details for the placeholder endpoints below
+NOT_IMPLEMENTED_QUERY = "Query generation not implemented yet"
+NOT_IMPLEMENTED_TABLES = "Table listing not implemented yet"
+NOT_IMPLEMENTED_VALIDATE = "SQL validation not implemented yet"
+NOT_IMPLEMENTED_FEEDBACK = "Feedback submission not implemented yet"
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
-    print("Starting SamvadQL backend...")
+    start_logging(logging.DEBUG if settings.debug else logging.INFO)
+    logger.info("Starting SamvadQL backend...")
     yield
     # Shutdown
-    print("Shutting down SamvadQL backend...")
+    logger.info("Shutting down SamvadQL backend...")
+    stop_logging()
 
 
 # Create FastAPI application
@@ -28,19 +42,21 @@ app = FastAPI(
     version=settings.api_version,
     description=settings.api_description,
     debug=settings.debug,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
 # Add middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.allowed_origins,
+    allow_origins=frozenset(settings.allowed_origins),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Brotli for clients that accept it, gzip otherwise; small bodies are sent as-is
+app.add_middleware(BrotliMiddleware, quality=4, minimum_size=4096, gzip_fallback=True)
 
 
 # Health check endpoint
@@ -66,30 +82,28 @@ async def get_status():
 async def submit_query(request: QueryRequest):
     """Submit natural language query for SQL generation."""
     # Placeholder implementation
-    raise HTTPException(status_code=501, detail="Query generation not implemented yet")
+    raise HTTPException(status_code=501, detail=NOT_IMPLEMENTED_QUERY)
 
 
 @app.get("/api/v1/tables/{database_id}")
 async def get_tables(database_id: str):
     """Get available tables for a database."""
     # Placeholder implementation
-    raise HTTPException(status_code=501, detail="Table listing not implemented yet")
+    raise HTTPException(status_code=501, detail=NOT_IMPLEMENTED_TABLES)
 
 
 @app.post("/api/v1/validate")
 async def validate_sql(sql: str, database_id: str):
     """Validate SQL query."""
     # Placeholder implementation
-    raise HTTPException(status_code=501, detail="SQL validation not implemented yet")
+    raise HTTPException(status_code=501, detail=NOT_IMPLEMENTED_VALIDATE)
 
 
 @app.post("/api/v1/feedback")
 async def submit_feedback(feedback: dict):
     """Submit user feedback."""
     # Placeholder implementation
-    raise HTTPException(
-        status_code=501, detail="Feedback submission not implemented yet"
-    )
+    raise HTTPException(status_code=501, detail=NOT_IMPLEMENTED_FEEDBACK)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,21 @@
 """Base data models for SamvadQL."""
 
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Any, Dict, List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
+import sys
 import uuid
 
+_utcnow = partial(datetime.now, timezone.utc)
+_uuid4 = uuid.uuid4
+
+
+def _new_id() -> str:
+    """Generate a random identifier in canonical dashed UUID form."""
+    return str(_uuid4())
+
 
 class DatabaseType(Enum):
     """Supported database types."""
@@ -23,9 +33,10 @@ class ValidationStatus(Enum):
     INVALID = "invalid"
     WARNING = "warning"
     UNSAFE = "unsafe"
+    PENDING = "pending"  # Partial result while generation is still streaming
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnSchema:
     """Database column schema information."""
 
@@ -37,8 +48,13 @@ class ColumnSchema:
     is_primary_key: bool = False
     is_foreign_key: bool = False
 
+    def __post_init__(self):
+        # Type names repeat across every table; share one string per name
+        if isinstance(self.data_type, str):
+            self.data_type = sys.intern(self.data_type)
+
 
-@dataclass
+@dataclass(slots=True)
 class TableSchema:
     """Database table schema information."""
 
@@ -53,8 +69,12 @@ class TableSchema:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+    def __post_init__(self):
+        if isinstance(self.tier, str):
+            self.tier = sys.intern(self.tier)
 
-@dataclass
+
+@dataclass(slots=True)
 class QueryRequest:
     """Natural language query request."""
 
@@ -64,10 +84,10 @@ class QueryRequest:
     selected_tables: Optional[List[str]] = None
     context: Optional[Dict[str, Any]] = None
     session_id: Optional[str] = None
-    request_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    request_id: str = field(default_factory=_new_id)
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """SQL validation result."""
 
@@ -79,7 +99,7 @@ class ValidationResult:
     execution_plan: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OptimizationSuggestion:
     """Query optimization suggestion."""
 
@@ -88,8 +108,12 @@ class OptimizationSuggestion:
     impact: str  # "high", "medium", "low"
     suggested_sql: Optional[str] = None
 
+    def __post_init__(self):
+        if isinstance(self.impact, str):
+            self.impact = sys.intern(self.impact)
+
 
-@dataclass
+@dataclass(slots=True)
 class QueryResponse:
     """Generated SQL query response."""
 
@@ -101,10 +125,10 @@ class QueryResponse:
     optimization_suggestions: List[OptimizationSuggestion] = field(default_factory=list)
     execution_time_estimate: Optional[float] = None
     request_id: Optional[str] = None
-    generated_at: datetime = field(default_factory=datetime.utcnow)
+    generated_at: datetime = field(default_factory=_utcnow)
 
 
-@dataclass
+@dataclass(slots=True)
 class TableRecommendation:
     """Table recommendation from vector search."""
 
@@ -114,7 +138,7 @@ class TableRecommendation:
     summary: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryContext:
     """Context for query generation."""
 
@@ -125,11 +149,11 @@ class QueryContext:
     user_preferences: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class UserFeedback:
     """User feedback on generated queries."""
 
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     user_id: str = ""
     query_id: str = ""
     original_query: str = ""
@@ -137,14 +161,18 @@ class UserFeedback:
     feedback_type: str = ""  # 'accept', 'reject', 'modify'
     comments: Optional[str] = None
     rating: Optional[int] = None
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_utcnow)
+
+    def __post_init__(self):
+        if isinstance(self.feedback_type, str):
+            self.feedback_type = sys.intern(self.feedback_type)
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditLogEntry:
     """Audit log entry."""
 
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     user_id: str = ""
     action: str = ""
     resource_type: str = ""
@@ -152,4 +180,12 @@ class AuditLogEntry:
     details: Dict[str, Any] = field(default_factory=dict)
     ip_address: Optional[str] = None
     user_agent: Optional[str] = None
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_utcnow)
+
+    def __post_init__(self):
+        # The same detail keys recur on every entry; share one string per key
+        if self.details:
+            self.details = {
+                sys.intern(k) if isinstance(k, str) else k: v
+                for k, v in self.details.items()
+            }
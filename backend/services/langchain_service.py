@@ -2,7 +2,10 @@
 LangChain-based LLM service implementation for SamvadQL.
 """
 
-from typing import AsyncIterator, List, Optional, Dict, Any, Coroutine
+import re
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Dict, Any, Coroutine, Tuple
+import orjson
 from pydantic.v1 import SecretStr
 from langchain.schema import BaseMessage, HumanMessage
 from langchain.callbacks.base import BaseCallbackHandler
@@ -15,10 +18,9 @@ from langchain.prompts import (
     SystemMessagePromptTemplate,
     HumanMessagePromptTemplate,
 )
-from langchain.memory import ConversationBufferMemory
 
 from core.interfaces import LLMServiceInterface
-from core.config import settings
+from core.config import get_settings
 from models.base import (
     QueryRequest,
     QueryResponse,
@@ -26,16 +28,147 @@ from models.base import (
     ValidationStatus,
 )
 
+# Upper bound on cached table schema prompt blocks per service instance
+SCHEMA_TEXT_CACHE_SIZE = 512
+
+# Number of streamed LLM chunks between partial QueryResponse updates
+STREAM_CHUNKS_PER_UPDATE = 8
+
+# ```sql fenced block; an unclosed fence (mid-stream) runs to end of text
+_SQL_BLOCK_RE = re.compile(r"```sql[^\n]*\n(.*?)(?:```|\Z)", re.DOTALL | re.IGNORECASE)
+
+GENERATE_SQL_SYSTEM_TEMPLATE = """You are an expert SQL query generator. Your task is to convert natural language questions into precise SQL queries.
+
+Available Tables and Schemas:
+{table_schemas}
+
+Guidelines:
+1. Generate syntactically correct SQL for the specified database type
+2. Use only the tables and columns provided in the schema
+3. Include clear explanations for your SQL choices
+4. Consider performance implications
+5. Avoid destructive operations unless explicitly requested
+
+Database Type: {database_type}
+Context: {context}"""
+
+GENERATE_SQL_HUMAN_TEMPLATE = """Convert this natural language question to SQL:
+
+Question: {query}
+
+Please provide:
+1. The SQL query
+2. A clear explanation of what the query does
+3. Which tables and columns you selected and why"""
+
+REFINE_QUERY_SYSTEM_TEMPLATE = """You are an expert SQL query refiner. Your task is to modify existing SQL queries based on user feedback.
+
+Original SQL Query:
+{original_sql}
+
+User's Refinement Request:
+{refinement_request}
+
+Guidelines:
+1. Understand what the user wants to change
+2. Modify the SQL query accordingly
+3. Maintain the original intent while incorporating the changes
+4. Explain what changes were made and why
+5. Ensure the refined query is syntactically correct
+
+Context: {context}"""
+
+REFINE_QUERY_HUMAN_TEMPLATE = """Please refine the SQL query based on the user's request. Provide:
+1. The refined SQL query
+2. Explanation of changes made
+3. Reasoning for the modifications"""
+
+CORRECT_SQL_SYSTEM_TEMPLATE = """You are an expert SQL debugger. Your task is to fix broken SQL queries.
+
+Invalid SQL Query:
+{invalid_sql}
+
+Error Message:
+{error_message}
+
+Guidelines:
+1. Analyze the error message to understand the issue
+2. Fix the SQL syntax or logic error
+3. Return only the corrected SQL query
+4. Ensure the corrected query maintains the original intent
+
+Context: {context}"""
+
+CORRECT_SQL_HUMAN_TEMPLATE = (
+    "Please fix this SQL query and return only the corrected SQL."
+)
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values orjson does not handle natively."""
+    if isinstance(value, (set, frozenset)):
+        # Sets iterate in hash order, which varies between runs
+        try:
+            return sorted(value)
+        except TypeError:
+            return sorted(value, key=repr)
+    return str(value)
+
+
+def _render_context(context: Optional[Dict[str, Any]]) -> str:
+    """Render prompt context as key-sorted JSON so equal contexts render identically."""
+    if not context:
+        return "None"
+    try:
+        return orjson.dumps(
+            context,
+            default=_json_default,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+    except TypeError:
+        # orjson.JSONEncodeError subclasses TypeError: >64-bit ints, tuple keys
+        return str(context)
+
 
 class LangChainLLMService(LLMServiceInterface):
     """LangChain-based implementation of LLM service."""
 
     def __init__(self):
         self.llm = self._initialize_llm()
-        self.memory = ConversationBufferMemory(return_messages=True)
+        # Prompts and chains are stateless and shared across requests;
+        # conversation history is passed explicitly via invoke_with_history
+        self._generate_sql_prompt = self._build_prompt(
+            GENERATE_SQL_SYSTEM_TEMPLATE, GENERATE_SQL_HUMAN_TEMPLATE
+        )
+        self._refine_query_chain = LLMChain(
+            llm=self.llm,
+            prompt=self._build_prompt(
+                REFINE_QUERY_SYSTEM_TEMPLATE, REFINE_QUERY_HUMAN_TEMPLATE
+            ),
+        )
+        self._correct_sql_chain = LLMChain(
+            llm=self.llm,
+            prompt=self._build_prompt(
+                CORRECT_SQL_SYSTEM_TEMPLATE, CORRECT_SQL_HUMAN_TEMPLATE
+            ),
+        )
+        # Formatted prompt text per (database_id, table name, updated_at)
+        self._schema_text_cache: Dict[Tuple[str, str, datetime], str] = {}
+
+    def _build_prompt(
+        self, system_template: str, human_template: str
+    ) -> ChatPromptTemplate:
+        """Build a chat prompt from a system and a human message template."""
+        return ChatPromptTemplate.from_messages(
+            [
+                SystemMessagePromptTemplate.from_template(system_template),
+                HumanMessagePromptTemplate.from_template(human_template),
+            ]
+        )
 
     def _initialize_llm(self):
         """Initialize the appropriate LLM based on configuration."""
+        settings = get_settings()
         if settings.llm_provider == "openai":
 
             return ChatOpenAI(
@@ -73,88 +206,79 @@ class LangChainLLMService(LLMServiceInterface):
     ) -> AsyncIterator[QueryResponse]:
         """Generate SQL from natural language query using LangChain."""
 
-        system_template = """You are an expert SQL query generator. Your task is to convert natural language questions into precise SQL queries.
-
-Available Tables and Schemas:
-{table_schemas}
-
-Guidelines:
-1. Generate syntactically correct SQL for the specified database type
-2. Use only the tables and columns provided in the schema
-3. Include clear explanations for your SQL choices
-4. Consider performance implications
-5. Avoid destructive operations unless explicitly requested
-
-Database Type: {database_type}
-Context: {context}"""
-
-        human_template = """Convert this natural language question to SQL:
-
-Question: {query}
-
-Please provide:
-1. The SQL query
-2. A clear explanation of what the query does
-3. Which tables and columns you selected and why"""
-
-        system_message_prompt = SystemMessagePromptTemplate.from_template(
-            system_template
-        )
-        human_message_prompt = HumanMessagePromptTemplate.from_template(human_template)
-        chat_prompt = ChatPromptTemplate.from_messages(
-            [system_message_prompt, human_message_prompt]
-        )
-
         table_schemas_text = self._format_table_schemas(tables)
 
-        chain = LLMChain(llm=self.llm, prompt=chat_prompt, memory=self.memory)
-
         chain_input = {
             "query": query,
             "table_schemas": table_schemas_text,
             "database_type": (
                 context.get("database_type", "postgresql") if context else "postgresql"
             ),
-            "context": str(context) if context else "None",
+            "context": _render_context(context),
         }
 
         if callbacks is None:
             callbacks = [StreamingStdOutCallbackHandler()]
 
-        try:
-            response = await chain.arun(**chain_input, callbacks=callbacks)
-            sql_query, explanation = self._parse_llm_response(response)
-
-            query_response = QueryResponse(
-                sql=sql_query,
-                explanation=explanation,
-                confidence_score=0.8,
-                selected_tables=[table.name for table in tables],
-                validation_status=ValidationStatus.VALID,
-                optimization_suggestions=[],
-                request_id=context.get("request_id") if context else None,
-            )
-
-            # Instead of yielding, return an async iterator that yields once
-            async def single_response():
-                yield query_response
-
-            return single_response()
-        except Exception as e:
-            error_response = QueryResponse(
-                sql="-- Error generating SQL",
-                explanation=f"Error: {str(e)}",
-                confidence_score=0.0,
-                selected_tables=[],
-                validation_status=ValidationStatus.INVALID,
-                optimization_suggestions=[],
-                request_id=context.get("request_id") if context else None,
-            )
-
-            async def error_response_gen():
-                yield error_response
+        messages = self._generate_sql_prompt.format_messages(**chain_input)
+        request_id = context.get("request_id") if context else None
+        selected_tables = [table.name for table in tables]
+
+        async def stream_responses():
+            chunks: List[str] = []
+            try:
+                async for chunk in self.llm.astream(
+                    messages, config={"callbacks": callbacks}
+                ):
+                    chunks.append(chunk.content)
+                    if len(chunks) % STREAM_CHUNKS_PER_UPDATE:
+                        continue
+
+                    # Partial update: until a ```sql fence has arrived the
+                    # text is all explanation, so never report prose as SQL
+                    partial = "".join(chunks)
+                    match = _SQL_BLOCK_RE.search(partial)
+                    if match is None:
+                        sql_query, explanation = "", partial
+                    else:
+                        sql_query = match.group(1)
+                        if not match.group(0).endswith("```"):
+                            # Drop a closing fence that has only partly arrived
+                            sql_query = sql_query.rstrip("`")
+                        sql_query = sql_query.strip()
+                        explanation = partial[: match.start()] + partial[match.end() :]
+                    yield QueryResponse(
+                        sql=sql_query,
+                        explanation=explanation,
+                        confidence_score=0.0,
+                        selected_tables=selected_tables,
+                        validation_status=ValidationStatus.PENDING,
+                        optimization_suggestions=[],
+                        request_id=request_id,
+                    )
+
+                sql_query, explanation = self._parse_llm_response("".join(chunks))
+                yield QueryResponse(
+                    sql=sql_query,
+                    explanation=explanation,
+                    confidence_score=0.8,
+                    selected_tables=selected_tables,
+                    validation_status=ValidationStatus.VALID,
+                    optimization_suggestions=[],
+                    request_id=request_id,
+                )
+            except Exception as e:
+                yield QueryResponse(
+                    sql="-- Error generating SQL",
+                    explanation=f"Error: {str(e)}",
+                    confidence_score=0.0,
+                    selected_tables=[],
+                    validation_status=ValidationStatus.INVALID,
+                    optimization_suggestions=[],
+                    request_id=request_id,
+                )
 
-            return error_response_gen()
+        return stream_responses()
 
     async def refine_query(
         self,
@@ -165,47 +289,16 @@ Please provide:
     ) -> AsyncIterator[QueryResponse]:
         """Refine existing SQL query based on user feedback."""
 
-        system_template = """You are an expert SQL query refiner. Your task is to modify existing SQL queries based on user feedback.
-
-Original SQL Query:
-{original_sql}
-
-User's Refinement Request:
-{refinement_request}
-
-Guidelines:
-1. Understand what the user wants to change
-2. Modify the SQL query accordingly
-3. Maintain the original intent while incorporating the changes
-4. Explain what changes were made and why
-5. Ensure the refined query is syntactically correct
-
-Context: {context}"""
-
-        human_template = """Please refine the SQL query based on the user's request. Provide:
-1. The refined SQL query
-2. Explanation of changes made
-3. Reasoning for the modifications"""
-
-        # Create and execute chain similar to generate_sql
-        system_message_prompt = SystemMessagePromptTemplate.from_template(
-            system_template
-        )
-        human_message_prompt = HumanMessagePromptTemplate.from_template(human_template)
-        chat_prompt = ChatPromptTemplate.from_messages(
-            [system_message_prompt, human_message_prompt]
-        )
-
-        chain = LLMChain(llm=self.llm, prompt=chat_prompt)
-
         chain_input = {
             "original_sql": original_sql,
             "refinement_request": refinement_request,
-            "context": str(context) if context else "None",
+            "context": _render_context(context),
         }
 
         try:
-            response = await chain.arun(**chain_input, callbacks=callbacks or [])
+            response = await self._refine_query_chain.arun(
+                **chain_input, callbacks=callbacks or []
+            )
             sql_query, explanation = self._parse_llm_response(response)
 
             query_response = QueryResponse(
@@ -247,44 +340,14 @@ Context: {context}"""
     ) -> str:
         """Attempt to correct invalid SQL using LangChain."""
 
-        system_template = """You are an expert SQL debugger. Your task is to fix broken SQL queries.
-
-Invalid SQL Query:
-{invalid_sql}
-
-Error Message:
-{error_message}
-
-Guidelines:
-1. Analyze the error message to understand the issue
-2. Fix the SQL syntax or logic error
-3. Return only the corrected SQL query
-4. Ensure the corrected query maintains the original intent
-
-Context: {context}"""
-
-        human_template = (
-            """Please fix this SQL query and return only the corrected SQL."""
-        )
-
-        system_message_prompt = SystemMessagePromptTemplate.from_template(
-            system_template
-        )
-        human_message_prompt = HumanMessagePromptTemplate.from_template(human_template)
-        chat_prompt = ChatPromptTemplate.from_messages(
-            [system_message_prompt, human_message_prompt]
-        )
-
-        chain = LLMChain(llm=self.llm, prompt=chat_prompt)
-
         chain_input = {
             "invalid_sql": invalid_sql,
             "error_message": error_message,
-            "context": str(context) if context else "None",
+            "context": _render_context(context),
         }
 
         try:
-            corrected_sql = await chain.arun(**chain_input)
+            corrected_sql = await self._correct_sql_chain.arun(**chain_input)
             return corrected_sql.strip()
         except Exception as e:
             return f"-- Unable to correct SQL: {str(e)}\n{invalid_sql}"
@@ -319,59 +382,54 @@ Context: {context}"""
         formatted_schemas = []
 
         for table in tables:
-            schema_text = f"Table: {table.name}\n"
-            if table.description:
-                schema_text += f"Description: {table.description}\n"
-
-            schema_text += "Columns:\n"
-            for column in table.columns:
-                col_info = f"  - {column.name} ({column.data_type})"
-                if column.description:
-                    col_info += f" - {column.description}"
-                if column.is_primary_key:
-                    col_info += " [PRIMARY KEY]"
-                if column.is_foreign_key:
-                    col_info += " [FOREIGN KEY]"
-                schema_text += col_info + "\n"
-
-            if table.sample_queries:
-                schema_text += (
-                    f"Sample queries: {', '.join(table.sample_queries[:3])}\n"
-                )
+            # Tables without updated_at carry no version to key on
+            if table.updated_at is None:
+                formatted_schemas.append(self._format_table_schema(table))
+                continue
 
+            key = (table.database_id, table.name, table.updated_at)
+            schema_text = self._schema_text_cache.get(key)
+            if schema_text is None:
+                schema_text = self._format_table_schema(table)
+                if len(self._schema_text_cache) >= SCHEMA_TEXT_CACHE_SIZE:
+                    # Evict the oldest entry
+                    del self._schema_text_cache[next(iter(self._schema_text_cache))]
+                self._schema_text_cache[key] = schema_text
             formatted_schemas.append(schema_text)
 
         return "\n".join(formatted_schemas)
 
-    def _parse_llm_response(self, response: str) -> tuple[str, str]:
-        """Parse LLM response to extract SQL and explanation."""
-        # This is a simple parser - in practice, you'd want more robust parsing
-        lines = response.strip().split("\n")
+    def _format_table_schema(self, table: TableSchema) -> str:
+        """Format a single table schema for prompt inclusion."""
+        parts = [f"Table: {table.name}\n"]
+        if table.description:
+            parts.append(f"Description: {table.description}\n")
 
-        sql_lines = []
-        explanation_lines = []
-        in_sql_block = False
+        parts.append("Columns:\n")
+        for column in table.columns:
+            parts.append(f"  - {column.name} ({column.data_type})")
+            if column.description:
+                parts.append(f" - {column.description}")
+            if column.is_primary_key:
+                parts.append(" [PRIMARY KEY]")
+            if column.is_foreign_key:
+                parts.append(" [FOREIGN KEY]")
+            parts.append("\n")
 
-        for line in lines:
-            if "```sql" in line.lower():
-                in_sql_block = True
-                continue
-            elif "```" in line and in_sql_block:
-                in_sql_block = False
-                continue
-            elif in_sql_block:
-                sql_lines.append(line)
-            else:
-                explanation_lines.append(line)
-
-        sql = "\n".join(sql_lines).strip() if sql_lines else response
-        explanation = (
-            "\n".join(explanation_lines).strip()
-            if explanation_lines
-            else "SQL query generated"
-        )
+        if table.sample_queries:
+            parts.append(f"Sample queries: {', '.join(table.sample_queries[:3])}\n")
+
+        return "".join(parts)
+
+    def _parse_llm_response(self, response: str) -> tuple[str, str]:
+        """Parse LLM response to extract SQL and explanation."""
+        match = _SQL_BLOCK_RE.search(response)
+        if match is None:
+            return response, response.strip() or "SQL query generated"
 
-        return sql, explanation
+        sql = match.group(1).strip() or response
+        explanation = (response[: match.start()] + response[match.end() :]).strip()
+        return sql, explanation or "SQL query generated"
 
     def _create_sql_generation_chain(self, **kwargs) -> LLMChain:
         """Create a specialized chain for SQL generation."""
@@ -3,7 +3,11 @@ Celery worker configuration for background tasks.
 """
 
 from celery import Celery
-from core.config import settings
+from celery.utils.log import get_task_logger
+from core.config import get_settings
+
+settings = get_settings()
+logger = get_task_logger(__name__)
 
 # Create Celery app
 celery_app = Celery(
@@ -32,5 +36,5 @@ celery_app.conf.update(
 @celery_app.task
 def sample_background_task(data: dict):
     """Sample background task."""
-    print(f"Processing background task with data: {data}")
+    logger.info("Processing background task with data: %s", data)
     return {"status": "completed", "data": data}
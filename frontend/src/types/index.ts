@@ -13,7 +13,8 @@ export enum ValidationStatus {
   VALID = 'valid',
   INVALID = 'invalid',
   WARNING = 'warning',
-  UNSAFE = 'unsafe'
+  UNSAFE = 'unsafe',
+  PENDING = 'pending'
 }
 
 export enum FeedbackType {
@@ -10,8 +10,8 @@ CREATE TABLE IF NOT EXISTS user_feedback (
     feedback_type VARCHAR(50) NOT NULL CHECK (feedback_type IN ('accept', 'reject', 'modify')),
     comments TEXT,
     rating INTEGER CHECK (rating >= 1 AND rating <= 5),
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
 );
 
 -- Audit log table
@@ -24,7 +24,7 @@ CREATE TABLE IF NOT EXISTS audit_log (
     details JSONB,
     ip_address INET,
     user_agent TEXT,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
 );
 
 -- Query execution log
@@ -35,7 +35,7 @@ CREATE TABLE IF NOT EXISTS query_execution_log (
     original_query TEXT NOT NULL,
     generated_sql TEXT NOT NULL,
     schema_versions JSONB NOT NULL,
-    execution_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    execution_timestamp TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
     execution_result TEXT,
     error_message TEXT,
     performance_metrics JSONB
@@ -95,8 +95,9 @@ CREATE INDEX IF NOT EXISTS idx_user_feedback_user_id ON user_feedback(user_id);
 CREATE INDEX IF NOT EXISTS idx_user_feedback_created_at ON user_feedback(created_at);
 CREATE INDEX IF NOT EXISTS idx_audit_log_user_id ON audit_log(user_id);
 CREATE INDEX IF NOT EXISTS idx_audit_log_created_at ON audit_log(created_at);
-CREATE INDEX IF NOT EXISTS idx_query_log_user_id ON query_execution_log(user_id);
+CREATE INDEX IF NOT EXISTS idx_query_log_user_timestamp ON query_execution_log(user_id, execution_timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_query_log_timestamp ON query_execution_log(execution_timestamp);
+CREATE INDEX IF NOT EXISTS idx_query_log_failed ON query_execution_log(execution_timestamp DESC) WHERE error_message IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_query_log_schema_versions ON query_execution_log USING GIN (schema_versions);
 CREATE INDEX IF NOT EXISTS idx_table_metadata_database_id ON table_metadata(database_id);
 CREATE INDEX IF NOT EXISTS idx_query_cache_hash ON query_cache(query_hash);
@@ -24,7 +24,7 @@ TYPE_MAPPINGS: Dict[str, str] = {
 # Shared constants
 DATABASE_TYPES = ["postgresql", "mysql", "snowflake", "bigquery"]
 
-VALIDATION_STATUSES = ["valid", "invalid", "warning", "unsafe"]
+VALIDATION_STATUSES = ["valid", "invalid", "warning", "unsafe", "pending"]
 
 FEEDBACK_TYPES = ["accept", "reject", "modify"]
 
@@ -7,6 +7,32 @@ import uuid
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
+# Simple regex to find table names after FROM and JOIN
+# Regex explanation:
+# \b(?:FROM|JOIN)\s+    : Matches 'FROM' or 'JOIN' as whole words, followed by whitespace
+# ([a-zA-Z_][a-zA-Z0-9_]* : Matches a table or schema name starting with a letter or underscore
+# (?:\.[a-zA-Z_][a-zA-Z0-9_]*)?) : Optionally matches '.tablename' for schema-qualified names
+_TABLE_REF_RE = re.compile(
+    r"\b(?:FROM|JOIN)\s+([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)?)",
+    re.IGNORECASE,
+)
+
+# Any of these keywords anywhere in the statement marks it as destructive
+DESTRUCTIVE_KEYWORDS = (
+    "DELETE",
+    "DROP",
+    "TRUNCATE",
+    "ALTER",
+    "UPDATE",
+    "INSERT",
+    "CREATE",
+    "REPLACE",
+)
+_DESTRUCTIVE_RE = re.compile("|".join(DESTRUCTIVE_KEYWORDS), re.IGNORECASE)
+
+# Alphanumeric with hyphens and underscores
+_DATABASE_ID_RE = re.compile(r"^[a-zA-Z0-9_-]+$")
+
 
 def generate_request_id() -> str:
     """Generate a unique request ID."""
@@ -23,13 +49,7 @@ def sanitize_sql(sql: str) -> str:  # type: ignore
 
 def extract_table_names(sql: str) -> List[str]:
     """Extract table names from SQL query."""
-    # Simple regex to find table names after FROM and JOIN
-    # Regex explanation:
-    # \b(?:FROM|JOIN)\s+    : Matches 'FROM' or 'JOIN' as whole words, followed by whitespace
-    # ([a-zA-Z_][a-zA-Z0-9_]* : Matches a table or schema name starting with a letter or underscore
-    # (?:\.[a-zA-Z_][a-zA-Z0-9_]*)?) : Optionally matches '.tablename' for schema-qualified names
-    pattern = r"\b(?:FROM|JOIN)\s+([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)?)"
-    matches = re.findall(pattern, sql, re.IGNORECASE)
+    matches = _TABLE_REF_RE.findall(sql)
 
     # Clean up schema prefixes
     tables = []
@@ -44,19 +64,7 @@ def extract_table_names(sql: str) -> List[str]:
 
 def is_destructive_query(sql: str) -> bool:
     """Check if SQL query contains destructive operations."""
-    destructive_keywords = [
-        "DELETE",
-        "DROP",
-        "TRUNCATE",
-        "ALTER",
-        "UPDATE",
-        "INSERT",
-        "CREATE",
-        "REPLACE",
-    ]
-
-    sql_upper = sql.upper()
-    return any(keyword in sql_upper for keyword in destructive_keywords)
+    return _DESTRUCTIVE_RE.search(sql) is not None
 
 
 def format_error_message(
@@ -72,9 +80,7 @@ def format_error_message(
 
 def validate_database_id(database_id: str) -> bool:
     """Validate database ID format."""
-    # Simple validation - alphanumeric with hyphens and underscores
-    pattern = r"^[a-zA-Z0-9_-]+$"
-    return bool(re.match(pattern, database_id))
+    return bool(_DATABASE_ID_RE.match(database_id))
 
 
 def truncate_text(text: str, max_length: int = 1000) -> str:  # type: ignore